@@ -16,7 +16,8 @@ def save_fig(outfile, **kwargs):
     """
     Outputs figure to specified location.
 
-    If format is None, infer format from outfile.
+    If format is None, infer format from outfile. The caller's data is left
+    unmodified, so it can be shared between calls.
     """
     log.debug(f'attempting to save to {outfile}')
     outfile = Path(outfile)
@@ -24,7 +25,7 @@ def save_fig(outfile, **kwargs):
     data = kwargs.pop('data')
     if data.index.dtype == 'O':
         try:
-            data.index = pd.to_datetime(data.index)
+            data = data.set_index(pd.to_datetime(data.index))
         except ValueError:
             pass
     format = outfile.suffix.strip('.')
@@ -6,52 +6,169 @@ bluesteel.graphics
 Utility functions for generating Mercatus style graphics objects and files.
 """
 
+import functools
 import io
 import logging
 
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pathlib import Path
-from PIL import Image as image
 
 from . import standard_formatting
 from . import specific_formatting
 
 
-LOGO = image.open(str(Path(__file__).parent.joinpath('mercatus_logo.eps')))
-LOGO.load(10)
 log = logging.getLogger(Path(__file__).stem)
-plt.style.use(str(Path(__file__).parent.joinpath('mercatus.mplstyle')))
-colors = [i['color'] for i in plt.rcParams['axes.prop_cycle']]
+
+
+def new_figure(fig=None):
+    """
+    Creates a figure and axes outside of pyplot's global figure manager
+
+    :param fig: an existing figure to clear and reuse, keeping its canvas
+
+    :returns: a tuple of the Figure and its Axes
+    """
+    if fig is None:
+        fig = Figure()
+        FigureCanvasAgg(fig)
+    else:
+        fig.clear()
+    return fig, fig.add_subplot(111)
+
+
+@functools.lru_cache(maxsize=1)
+def worker_figure():
+    """
+    Returns the figure a worker process reuses for every chart it renders
+    """
+    return new_figure()[0]
+
+
+def resolve_colors(color, count):
+    """
+    Looks up the style colors for each series once per chart
+
+    :param color: list of indices into the style's color cycle
+    :param count: number of series being drawn
+
+    :returns: a tuple of color strings, one per series
+    """
+    if count > 1 and color == [0]:
+        color = range(count)
+    return tuple(standard_formatting.colors[int(i)] for i in color)
+
+
+def stacked_bottoms(values):
+    """
+    Computes the base of every segment of a stacked chart in one pass
+
+    Missing values add nothing to the running total, so a segment after a
+    gap sits on top of the segments below it rather than at zero.
+
+    :param values: 2-D array of chart values with one column per series
+
+    :returns: array of the running total beneath each value
+    """
+    bottoms = np.zeros(values.shape)
+    np.nancumsum(values[:, :-1], axis=1, out=bottoms[:, 1:])
+    return bottoms
 
 
 # Overarching Functions that Direct to the Correct Chart Type
-def create_image(data, format='png', **kwargs):
+def create_image(data, format='png', pil_kwargs=None, **kwargs):
     """
     Create an image of a chart
 
     :param data: a DataFrame representing the data to be charted
     :param kind: type of chart to create
     :param format: three-letter code for the image type to be created
+    :param pil_kwargs: encoder options passed to Pillow for raster formats,
+        e.g. {'compress_level': 1} for faster, larger PNGs
     :param **kwargs: settings for the chart
 
     :returns: a BytesIO holding the image
     """
     imagebuffer = io.BytesIO()
     fig = create_figure(data, **kwargs)
+    savefig_kwargs = {'pil_kwargs': pil_kwargs} if pil_kwargs else {}
     fig.savefig(
         imagebuffer,
         format=format,
         bbox_inches='tight',
-        dpi='figure'
+        dpi='figure',
+        **savefig_kwargs
     )
     imagebuffer.seek(0)
-    plt.close('all')
 
     return imagebuffer
 
 
+def create_array(data, **kwargs):
+    """
+    Create an array of a chart's pixels without encoding an image file
+
+    :param data: a DataFrame representing the data to be charted
+    :param **kwargs: settings for the chart
+
+    :returns: a (height, width, 4) array of RGBA values viewing the
+        rendered canvas
+    """
+    fig = create_figure(data, **kwargs)
+    fig.canvas.draw()
+    width, height = fig.canvas.get_width_height()
+
+    # Older matplotlib hands back a flat buffer, so shape it explicitly
+    return np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8).reshape(
+        height, width, 4)
+
+
+def create_images(datas, format='png', workers=None, **kwargs):
+    """
+    Create images of several charts in parallel worker processes
+
+    :param datas: an iterable of DataFrames, one per chart
+    :param format: three-letter code for the image type to be created
+    :param workers: number of worker processes, defaults to the CPU count
+    :param **kwargs: settings shared by every chart
+
+    :returns: a list of BytesIO objects holding the images, in input order
+    """
+    return create_image_batch(
+        (dict(kwargs, data=data, format=format) for data in datas), workers)
+
+
+def create_image_batch(jobs, workers=None):
+    """
+    Create images of charts with differing settings in parallel worker
+    processes
+
+    :param jobs: an iterable of dicts of create_image arguments, each
+        including the data for its chart; each worker draws on its own
+        figure, so jobs may not pass fig
+    :param workers: number of worker processes, defaults to the CPU count
+
+    :returns: a list of BytesIO objects holding the images, in job order
+    """
+    jobs = list(jobs)
+    if any('fig' in job for job in jobs):
+        raise TypeError('batch jobs cannot pass fig; each worker process '
+                        'draws on its own figure')
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(render_job, jobs))
+
+
+def render_job(job):
+    """
+    Create an image from a dict of create_image arguments in a worker
+    """
+    return create_image(fig=worker_figure(), **job)
+
+
 def create_figure(data, kind='line', **kwargs):
     """
     Dispatcher function for different chart types.
@@ -73,21 +190,23 @@ def create_figure(data, kind='line', **kwargs):
 
 
 # Start of Individual Chart Types
-def draw_scatter_plot(data, grid=None, **kwargs):
+def draw_scatter_plot(data, grid=None, fig=None, **kwargs):
     """
     Creates standard scatter plot and returns figure
 
     :param data: input data
     :param grid: add grid lines
+    :param fig: an existing figure to clear and draw on
     :param **kwargs: passed through to formatting function
     """
-    fig, ax = plt.subplots()
+    fig, ax = new_figure(fig)
     x_value = data.index.values
+    values = data.values
 
-    for column in list(data):
-        ax.scatter(x_value, data[column])
+    for i in range(values.shape[1]):
+        ax.scatter(x_value, values[:, i])
     if len(list(data)) > 1:
-        plt.legend(frameon=True)
+        ax.legend(frameon=True)
     if grid:
         ax.set(axisbelow=True)
         ax.grid(axis='y')
@@ -98,7 +217,7 @@ def draw_scatter_plot(data, grid=None, **kwargs):
 
 
 def draw_line_chart(data, line_thickness=2, label_lines=None, color=[0],
-                    grid=None, **kwargs):
+                    grid=None, fig=None, **kwargs):
     """Creates standard line chart and returns figure
 
     :param data: input data
@@ -106,20 +225,22 @@ def draw_line_chart(data, line_thickness=2, label_lines=None, color=[0],
     :param label_lines: shows label at end of line
     :param color: sets starting color
     :param grid: add grid lines
+    :param fig: an existing figure to clear and draw on
     :param **kwargs: passed through to formatting function
     """
-    fig, ax = plt.subplots()
-    if (len(data.columns) > 1) and (color == [0]):
-        color = list(np.arange(0, len(data.columns)))
-    for i, (_, series) in enumerate(data.items()):
-        ax.plot(series, lw=line_thickness, color=colors[int(color[i])])
+    fig, ax = new_figure(fig)
+    values = data.values
+    color = resolve_colors(color, len(data.columns))
+    lines = ax.plot(data.index, values, lw=line_thickness)
+    for i, line in enumerate(lines):
+        line.set_color(color[i])
     if len(data.index) < 6:
         ax.set_xticks(data.index)
     if label_lines:
-        for name, series in data.items():
+        for name, value in zip(data.columns, values[-1]):
             ax.text(
-                series.index[-1], series.iloc[-1],
-                f'{name}: {series.iloc[-1]:,.0f}',
+                data.index[-1], value,
+                f'{name}: {value:,.0f}',
                 va='center',
                 ha='left',
                 size='small'
@@ -134,25 +255,25 @@ def draw_line_chart(data, line_thickness=2, label_lines=None, color=[0],
     return standard_formatting.format_figure(data, fig, **kwargs)
 
 
-def draw_stacked_area_chart(data, label_area=None, grid=None, **kwargs):
+def draw_stacked_area_chart(data, label_area=None, grid=None, fig=None,
+                            **kwargs):
     """Creates filled line chart and returns figure
 
     :param data: input data
     :param label_area: adds area labels
     :param grid: add grid lines
+    :param fig: an existing figure to clear and draw on
     :param **kwargs: passed through to formatting function
     """
-    fig, ax = plt.subplots()
+    fig, ax = new_figure(fig)
     x_values = data.index.values
-    y_values = np.row_stack(data[i] for i in list(data))
-    ax.stackplot(x_values, y_values)
+    ax.stackplot(x_values, data.values.T)
     if len(data.index) < 6:
         ax.set_xticks(data.index)
     if label_area:
-        stacked = data.cumsum(axis='columns')
         xmid = sum(ax.get_xbound()) / 2
-        midvals = [0] + stacked.xs(xmid).tolist()
-        for name, lower, upper in zip(stacked.columns, midvals[: -1],
+        midvals = [0] + data.xs(xmid).cumsum().tolist()
+        for name, lower, upper in zip(data.columns, midvals[: -1],
                                       midvals[1:]):
             ax.text(xmid, (lower + upper) / 2, name, va='center', ha='center')
     if grid:
@@ -166,27 +287,28 @@ def draw_stacked_area_chart(data, label_area=None, grid=None, **kwargs):
 
 
 def draw_vertical_bar_chart(data, label_bars=None, color=[0],
-                            grid=None, **kwargs):
+                            grid=None, fig=None, **kwargs):
     """Creates vertical bar chart and returns figure
 
     :param data: input data
     :param label_bars: add data labels to bars
     :param color: starting color
     :grid: turns grid lines off
+    :param fig: an existing figure to clear and draw on
     :param **kwargs: passed through to formatting function
     """
-    fig, ax = plt.subplots()
+    fig, ax = new_figure(fig)
     bars = np.arange(len(data.index))
     width = (2 / 3) / len(data.columns)
-    if (len(data.columns) > 1) and (color == [0]):
-        color = list(np.arange(0, len(data.columns)))
-    for i, (_, series) in enumerate(data.items()):
-        ax.bar(bars + i * width, series.values, width,
-               color=colors[int(color[i])])
+    values = data.values
+    color = resolve_colors(color, len(data.columns))
+    for i in range(values.shape[1]):
+        column = values[:, i]
+        ax.bar(bars + i * width, column, width, color=color[i])
         if label_bars:
-            for j, k in zip(bars, series.values):
-                ax.text(j + i * width,
-                        series.iloc[j] + series.values.max() * .01,
+            offset = column.max() * .01
+            for j, k in zip(bars, column):
+                ax.text(j + i * width, k + offset,
                         "{:,.0f}".format(k), va='bottom', ha='center',
                         size=(18 - len(data.columns) * 3))
     ax.set_xticks(bars + width * (len(data.columns) * 0.5 - 0.5))
@@ -203,22 +325,23 @@ def draw_vertical_bar_chart(data, label_bars=None, color=[0],
     return standard_formatting.format_figure(data, fig, **kwargs)
 
 
-def draw_vertical_stacked_bar(data, color=[0], **kwargs):
+def draw_vertical_stacked_bar(data, color=[0], fig=None, **kwargs):
     """Creates stacked vertical bar chart and returns figure
 
     :param data input data
     :param color: starting color
+    :param fig: an existing figure to clear and draw on
     :param **kwargs: passed through to formatting function
     """
-    fig, ax = plt.subplots()
+    fig, ax = new_figure(fig)
     bars = np.arange(len(data.index))
     width = .66
-    data_bottoms = data.cumsum(axis=1).shift(1, axis=1).fillna(0)
-    if (len(data.columns) > 1) and (color == [0]):
-        color = list(np.arange(0, len(data.columns)))
-    for i, column in enumerate(data.columns[::-1]):
-        ax.bar(bars, data[column], bottom=data_bottoms[column],
-               width=width, label=column, color=colors[int(color[i])])
+    values = data.values.astype(float)
+    bottoms = stacked_bottoms(values)
+    color = resolve_colors(color, len(data.columns))
+    for i, j in enumerate(reversed(range(len(data.columns)))):
+        ax.bar(bars, values[:, j], bottom=bottoms[:, j], width=width,
+               label=data.columns[j], color=color[i])
     ax.legend()
     ax.set_xticks(bars)
     fig = specific_formatting.axis_labels_vbar(fig, ax, data, **kwargs)
@@ -227,7 +350,7 @@ def draw_vertical_stacked_bar(data, color=[0], **kwargs):
 
 
 def draw_horizontal_bar_chart(data, label_bars=None, color=[0], xlabel=None,
-                              ylabel=None, grid=None, **kwargs):
+                              ylabel=None, grid=None, fig=None, **kwargs):
     """Creates horizontal bar chart and returns figure
 
     :param data: input data
@@ -235,21 +358,23 @@ def draw_horizontal_bar_chart(data, label_bars=None, color=[0], xlabel=None,
     :param color: starting color
     :param xlabel: label for xaxis
     :param ylabel: label for yaxis
+    :param fig: an existing figure to clear and draw on
     :param **kwargs: passed through to formatting function
     """
-    fig, ax = plt.subplots()
+    fig, ax = new_figure(fig)
     bars = np.arange(len(data.index))
     height = (2 / 3) / len(data.columns)
-    if (len(data.columns) > 1) and (color == [0]):
-        color = list(np.arange(0, len(data.columns)))
-    for i, (_, series) in enumerate(data.items()):
-        ax.barh(bars + i * height, series.values, height,
-                color=colors[int(color[i])])
+    values = data.values
+    color = resolve_colors(color, len(data.columns))
+    for i in range(values.shape[1]):
+        column = values[:, i]
+        ax.barh(bars + i * height, column, height, color=color[i])
         if label_bars:
-            for j, k in zip(bars, series.values):
-                ax.text(series.iloc[j] + series.values.max() * .01,
-                        j + i * height, "{:,.0f}".format(k), va='center',
-                        ha='left', size=(18 - len(data.columns) * 3))
+            offset = column.max() * .01
+            for j, k in zip(bars, column):
+                ax.text(k + offset, j + i * height, "{:,.0f}".format(k),
+                        va='center', ha='left',
+                        size=(18 - len(data.columns) * 3))
     ax.set_yticks(bars + height * (len(data.columns) * 0.5 - 0.5))
 
     fig = specific_formatting.axis_labels_hbar(fig, ax, data, **kwargs)
@@ -270,7 +395,7 @@ def draw_horizontal_bar_chart(data, label_bars=None, color=[0], xlabel=None,
 
 
 def draw_horizontal_stacked_bar(data, label_bars=None, color=[0], xlabel=None,
-                                ylabel=None, grid=None, **kwargs):
+                                ylabel=None, grid=None, fig=None, **kwargs):
     """Creates stacked horizontal bar chart and returns figure
 
     :param data input data
@@ -278,17 +403,18 @@ def draw_horizontal_stacked_bar(data, label_bars=None, color=[0], xlabel=None,
     :param color: starting color
     :param xlabel: label for xaxis
     :param ylabel: label for yaxis
+    :param fig: an existing figure to clear and draw on
     :param **kwargs: passed through to formatting function
     """
-    fig, ax = plt.subplots()
+    fig, ax = new_figure(fig)
     bars = np.arange(len(data.index))
     height = .66
-    data_bottoms = data.cumsum(axis=1).shift(1, axis=1).fillna(0)
-    if (len(data.columns) > 1) and (color == [0]):
-        color = list(np.arange(0, len(data.columns)))
-    for i, column in enumerate(data):
-        ax.barh(bars, data[column], left=data_bottoms[column],
-                height=height, label=column, color=colors[int(color[i])])
+    values = data.values.astype(float)
+    bottoms = stacked_bottoms(values)
+    color = resolve_colors(color, len(data.columns))
+    for i, column in enumerate(data.columns):
+        ax.barh(bars, values[:, i], left=bottoms[:, i], height=height,
+                label=column, color=color[i])
     ax.legend()
     ax.set_yticks(bars)
     fig = specific_formatting.axis_labels_hbar(fig, ax, data, **kwargs)
@@ -3,9 +3,52 @@ import datetime
 import logging
 import textwrap
 
+import numpy as np
+
 from pathlib import Path
 
 log = logging.getLogger(Path(__file__).stem)
+label_wrapper = textwrap.TextWrapper(width=30)
+
+
+def format_thousands(ticks):
+    """
+    Formats tick values in thousands, leaving a zero tick unlabeled. Labels
+    keep their decimals only if any value is not a multiple of 1000.
+
+    :param ticks: sequence of numeric tick values
+
+    :returns: list of tick label strings
+    """
+    ticks = np.asarray(ticks, dtype=np.float64)
+    scaled = ticks / 1000
+    if (np.mod(ticks, 1000) != 0).any():
+        labels = [f"{i:,}" for i in scaled]
+    else:
+        labels = [f"{i:,.0f}" for i in scaled]
+    return np.where(ticks == 0, '', labels).tolist()
+
+
+def format_ticks(ticks, axis, year=None):
+    """
+    Formats numeric tick values as labels. Values of a million or more are
+    shown in thousands, years are shown as plain integers, and anything
+    else gets thousands separators.
+
+    :param ticks: sequence of numeric tick values
+    :param axis: name of the axis, used when warning about truncation
+    :param year: show the values as years
+
+    :returns: list of tick labels
+    """
+    ticks = np.asarray(ticks, dtype=np.float64)
+    if ticks.max() >= 1000000:
+        log.warning(f'The {axis} values have been truncated by an order of '
+                    '1000. Mark this on somewhere the chart.')
+        return format_thousands(ticks)
+    if year:
+        return ticks.astype(int).tolist()
+    return ['{:,.0f}'.format(i) for i in ticks]
 
 
 # Formatting that is Specific Based on Chart Type
@@ -88,42 +131,13 @@ def set_ticks_nonbar(fig, ax, xtick_loc=None, xticklabels=None,
     # Formats matplotlibs default setting of labels, sets labels
     if not xticklabels:
         xticklabels = ax.get_xticks()
-        if len(ax.get_xticklabels()[0].get_text()) == 0:
-            if max(xticklabels) >= 1000000:
-                # Check to see if any labels need to be formatted as floats
-                if any([i % 1000 for i in xticklabels]):
-                    xticklabels = ['' if not i else f"{i / 1000:,}" for i in
-                                   xticklabels]
-                else:
-                    xticklabels = ['' if not i else f"{i / 1000:,.0f}" for i in
-                                   xticklabels]
-                log.warning('The x values have been truncated by an order of '
-                            '1000. Mark this on somewhere the chart.')
-            else:
-                if not xyear:
-                    xticklabels = ['{:,.0f}'.format(i) for i in
-                                   ax.get_xticks()]
-                else:
-                    xticklabels = [int(i) for i in ax.get_xticks()]
+        if ax.xaxis.isDefault_majfmt:
+            xticklabels = format_ticks(xticklabels, 'x', xyear)
             ax.set_xticklabels(xticklabels)
     if not yticklabels:
         yticklabels = ax.get_yticks()
-        if len(ax.get_yticklabels()[0].get_text()) == 0:
-            if max(yticklabels) >= 1000000:
-                if any([i % 1000 for i in yticklabels]):
-                    yticklabels = ['' if not i else f"{i / 1000:,}" for i in
-                                   yticklabels]
-                else:
-                    yticklabels = ['' if not i else f"{i / 1000:,.0f}" for i in
-                                   yticklabels]
-                log.warning('The y values have been truncated by an order of '
-                            '1000. Mark this on somewhere the chart.')
-            else:
-                if not yyear:
-                    yticklabels = ['{:,.0f}'.format(i) for i in
-                                   ax.get_yticks()]
-                else:
-                    yticklabels = [int(i) for i in ax.get_yticks()]
+        if ax.yaxis.isDefault_majfmt:
+            yticklabels = format_ticks(yticklabels, 'y', yyear)
             ax.set_yticklabels(yticklabels)
 
     return fig
@@ -163,54 +177,29 @@ def axis_labels_vbar(fig, ax, data, xyear=None, yyear=None, xticklabels=None,
     if not xticklabels:
         xticklabels = data.index.values
         if type(xticklabels[0]) != str:
-            if max(xticklabels) >= 1000000:
-                # Check to see if any labels need to be formatted as floats
-                if any([i % 1000 for i in xticklabels]):
-                    xticklabels = ['' if not i else f"{i / 1000:,}" for i in
-                                   xticklabels]
-                else:
-                    xticklabels = ['' if not i else f"{i / 1000:,.0f}" for i in
-                                   xticklabels]
-                log.warning('The x values have been truncated by an order of '
-                            '1000. Mark this on somewhere the chart.')
-            else:
-                if not xyear:
-                    xticklabels = ['{:,.0f}'.format(i) for i in
-                                   data.index.values]
-                else:
-                    xticklabels = [int(i) for i in data.index.values]
+            xticklabels = format_ticks(xticklabels, 'x', xyear)
         ax.set_xticklabels(xticklabels)
     if not yticklabels:
         yticklabels = ax.get_yticks()
-        if len(ax.get_yticklabels()[0].get_text()) == 0:
-            if max(yticklabels) >= 1000000:
-                if any([i % 1000 for i in yticklabels]):
-                    yticklabels = ['' if not i else f"{i / 1000:,}" for i in
-                                   yticklabels]
-                else:
-                    yticklabels = ['' if not i else f"{i / 1000:,.0f}" for i in
-                                   yticklabels]
-                log.warning('The y values have been truncated by an order of '
-                            '1000. Mark this on somewhere the chart.')
-            else:
-                yticklabels = ['{:,.0f}'.format(i) for i in ax.get_yticks()]
+        if ax.yaxis.isDefault_majfmt:
+            yticklabels = format_ticks(yticklabels, 'y')
         ax.set_yticklabels(yticklabels)
 
     # Informs the user to consider h-bar if labels are too long
-    label = ax.xaxis.get_ticklabels()[0]
+    labels = ax.xaxis.get_ticklabels()
+    label = labels[0]
     if len(label.get_text()) == 4 and label.get_text().isdigit:
-        if len(ax.xaxis.get_ticklabels()) > 12:
-            for label in ax.xaxis.get_ticklabels()[1::2]:
+        if len(labels) > 12:
+            for label in labels[1::2]:
                 label.set_visible(False)
     else:
-        length_list = []
-        for item in ax.xaxis.get_ticklabels():
-            length_list.append(len(item.get_text()))
-            total_length = sum(length_list)
-            if ((len(item.get_text()) > 9) or
+        total_length = 0
+        for item in labels:
+            length = len(item.get_text())
+            total_length += length
+            if ((length > 9) or
                     (total_length > 49) or
-                    (len(item.get_text()) > 6 and
-                     len(ax.xaxis.get_ticklabels()) > 7)):
+                    (length > 6 and len(labels) > 7)):
                 log.warning('You may want to consider using a horizontal_bar '
                             'chart so that all of your x-axis labels are '
                             'readable. Use the command --kind horizontal_bar.')
@@ -244,39 +233,16 @@ def axis_labels_hbar(fig, ax, data, xtick_loc=None, xticklabels=None,
     # Reduces size of labels greater than 6 digits
     if not xticklabels:
         xtick_labels = ax.get_xticks()
-        if len(ax.get_xticklabels()[0].get_text()) == 0:
-            if max(xtick_labels) >= 1000000:
-                if any([i % 1000 for i in xtick_labels]):
-                    xtick_labels = ['' if not i else f"{i / 1000:,}" for i in
-                                    xtick_labels]
-                else:
-                    xtick_labels = ['' if not i else f"{i / 1000:,.0f}" for
-                                    i in xtick_labels]
-                log.warning('The x values have been truncated by an order of '
-                            '1000. Mark this on somewhere the chart.')
-            else:
-                xtick_labels = ['{:,.0f}'.format(i) for i in ax.get_xticks()]
+        if ax.xaxis.isDefault_majfmt:
+            xtick_labels = format_ticks(xtick_labels, 'x')
         ax.set_xticklabels(xtick_labels)
     if not yticklabels:
         yticklabels = data.index.values
         if (type(yticklabels[0]) != str and
                 type(yticklabels[0]) != datetime.datetime):
-            if max(yticklabels) >= 1000000:
-                if any([i % 1000 for i in yticklabels]):
-                    yticklabels = ['' if not i else f"{i / 1000:,}" for i in
-                                   yticklabels]
-                else:
-                    yticklabels = ['' if not i else f"{i / 1000:,.0f}" for i in
-                                   yticklabels]
-                log.warning('The y values have been truncated by an order of '
-                            '1000. Mark this on somewhere the chart.')
-            else:
-                if not yyear:
-                    yticklabels = ['{:,.0f}'.format(i) for i in
-                                   yticklabels]
-                else:
-                    yticklabels = [int(i) for i in data.index.values]
-        yticklabels = [textwrap.fill(i, 30) for i in yticklabels]
+            yticklabels = format_ticks(yticklabels, 'y', yyear)
+        yticklabels = [label_wrapper.fill(i) if isinstance(i, str) else i
+                       for i in yticklabels]
         ax.set_yticklabels(yticklabels)
 
     return fig
@@ -1,16 +1,74 @@
+import functools
 import logging
-import matplotlib.pyplot as plt
+import matplotlib
+import matplotlib.axes
+import matplotlib.style
+import numpy as np
+import os
 import re
 from pathlib import Path
 from PIL import Image as image
 
 
-# Sets overarching style attributes
-LOGO = image.open(str(Path(__file__).parent.joinpath('mercatus_logo.eps')))
-LOGO.load(10)
 log = logging.getLogger(Path(__file__).stem)
-plt.style.use(str(Path(__file__).parent.joinpath('mercatus.mplstyle')))
-colors = [i['color'] for i in plt.rcParams['axes.prop_cycle']]
+LOGO_PATH = Path(__file__).parent.joinpath('mercatus_logo.eps')
+LOGO_CACHE_PATH = LOGO_PATH.with_suffix('.png')
+
+
+@functools.lru_cache(maxsize=1)
+def load_logo():
+    """
+    Loads the logo on first use from its rasterized PNG copy, only invoking
+    Ghostscript on the EPS when that copy is missing or older than the EPS
+
+    :returns: the logo as a PIL Image
+    """
+    try:
+        if LOGO_CACHE_PATH.stat().st_mtime >= LOGO_PATH.stat().st_mtime:
+            return image.open(str(LOGO_CACHE_PATH))
+    except OSError:
+        pass
+    logo = image.open(str(LOGO_PATH))
+    logo.load(10)
+    # Write beside the cache and swap it in so that concurrent processes never
+    # open a half-written copy
+    partial = LOGO_CACHE_PATH.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        logo.save(str(partial), 'PNG')
+        partial.replace(LOGO_CACHE_PATH)
+    except OSError:
+        log.debug(f'unable to cache rasterized logo at {LOGO_CACHE_PATH}')
+    return logo
+
+
+# Sets overarching style attributes
+STYLE_PATH = Path(__file__).parent.joinpath('mercatus.mplstyle')
+matplotlib.style.use(str(STYLE_PATH))
+colors = [i['color'] for i in matplotlib.rcParams['axes.prop_cycle']]
+CHART_PARAMS = frozenset([
+    'kind', 'title', 'size', 'xmin', 'ymin', 'ymax', 'xmax', 'xlabel',
+    'ylabel', 'source', 'spines', 'xtick_loc', 'ytick_loc', 'xticklabels',
+    'yticklabels', 'xyear', 'yyear', 'rot', 'xlabel_off', 'ylabel_off',
+    'label_bars', 'label_lines', 'label_area', 'line_thickness', 'color',
+    'grid'
+])
+AXES_PARAMS = frozenset(i[len('set_'):] for i in dir(matplotlib.axes.Axes)
+                        if i.startswith('set_'))
+
+
+@functools.lru_cache(maxsize=16)
+def resize_logo(width):
+    """
+    Resizes the logo to a pixel width, keeping its aspect ratio. Charts
+    sharing a size and dpi reuse the same resized pixels.
+
+    :param width: logo width in pixels
+
+    :returns: a read-only array of the resized logo
+    """
+    logo = load_logo()
+    return np.asarray(logo.resize(
+        (width, int(width * logo.height / logo.width))))
 
 
 # Formatting that every chart type is directed through
@@ -59,7 +117,7 @@ def format_figure(data, fig, spines=False, title=False, xlabel_off=False,
 
     # Rotates the x-axis according to user input
     if rot:
-        plt.xticks(rotation=rot)
+        ax.tick_params(axis='x', labelrotation=rot)
 
     # Source
     if source:
@@ -77,36 +135,18 @@ def format_figure(data, fig, spines=False, title=False, xlabel_off=False,
     figwidth = fig.get_size_inches()[0] * fig.dpi
 
     logo_width = int(figwidth / 3)
-    if phoenix:
-        fig.figimage(LOGO.resize(
-            (logo_width,
-             int(logo_width * LOGO.height / LOGO.width))),
-            xo=fig.dpi / 16,
-            yo=fig.dpi / 16,
-            origin='lower'
-        )
-    else:
-        fig.figimage(LOGO.resize(
-            (logo_width,
-             int(logo_width * LOGO.height / LOGO.width))),
-            xo=fig.dpi / 16,
-            yo=fig.dpi / 16,
-            origin='upper'
-        )
+    fig.figimage(
+        resize_logo(logo_width),
+        xo=fig.dpi / 16,
+        yo=fig.dpi / 16,
+        origin='lower' if phoenix else 'upper'
+    )
 
     # Tests for false params
-    test_fig, test_ax = plt.subplots()
-    variable_list = ['kind', 'title', 'size', 'xmin', 'ymin', 'ymax', 'xmax',
-                     'xlabel', 'ylabel', 'source', 'spines', 'xtick_loc',
-                     'ytick_loc', 'xticklabels', 'yticklabels', 'xyear',
-                     'yyear', 'rot', 'xlabel_off', 'ylabel_off', 'label_bars',
-                     'label_lines', 'label_area', 'line_thickness',
-                     'color', 'grid']
-    for i in variable_list:
-        try:
-            kwargs.pop(i)
-        except KeyError:
-            pass
-    test_ax.set(**{i: j for i, j in kwargs.items() if j is not None})
+    false_params = [i for i, j in kwargs.items() if j is not None and
+                    i not in CHART_PARAMS and i not in AXES_PARAMS]
+    if false_params:
+        raise AttributeError(
+            f'unexpected chart parameters: {", ".join(false_params)}')
 
     return fig
@@ -8,11 +8,12 @@ from pathlib import Path
 from setuptools import setup
 
 
+VERSION_RE = re.compile(r"^__version__ = ['\"]([^'\"]*)['\"]", re.M)
+
 version_path = Path(__file__).parent.joinpath(
     'bluesteel', 'graphics', '__init__.py')
-version = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]",
-                    version_path.read_text(encoding='utf-8'),
-                    re.M).group(1)
+version = VERSION_RE.search(
+    version_path.read_text(encoding='utf-8')).group(1)
 
 setup(
     name='bluesteel-graphics',
@@ -26,9 +27,12 @@ setup(
     ],
     extras_require={
         'test': [
+            'pyarrow>=0.13',
+            'pytest>=6',
             'pytest-cov',
-            'pytest-flake8',
-            'pytest-mpl'
+            'pytest-flake8>=1.0.7',
+            'pytest-mpl',
+            'pytest-xdist'
         ],
     },
     include_package_data=True
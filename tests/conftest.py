@@ -0,0 +1,143 @@
+import hashlib
+import matplotlib
+import pandas as pd
+import pytest
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from pathlib import Path
+
+# Nothing in the suite is displayed, so pin the non-interactive Agg backend
+# in every pytest-xdist worker, even if a plugin has already imported pyplot
+# with a GUI backend
+matplotlib.use('Agg', force=True)
+
+import bluesteel.graphics
+
+PACKAGE_DIR = Path(bluesteel.graphics.__file__).parent
+TEST_DATA_DIR = Path(__file__).parent.joinpath('test_data')
+BASELINE_DIR = Path(__file__).parent.joinpath('baseline')
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--mpl-skip-unchanged', action='store_true',
+        help='skip image comparisons whose inputs are unchanged since they '
+             'last passed'
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Remembers the inputs of image comparisons that passed"""
+    outcome = yield
+    report = outcome.get_result()
+    image_key = getattr(item, 'image_key', None)
+    if image_key and report.when == 'call' and report.passed:
+        item.config.cache.set(*image_key)
+
+
+def read_test_data(path):
+    """
+    Reads a CSV fixture from its Parquet copy when one is at least as new as
+    the CSV, otherwise with pyarrow's multithreaded CSV parser, falling back
+    to the pandas C parser if pyarrow or the pandas pyarrow engine is missing
+    """
+    parquet_path = path.with_suffix('.parquet')
+    fresh = (parquet_path.exists() and
+             parquet_path.stat().st_mtime >= path.stat().st_mtime)
+    if fresh:
+        try:
+            return pd.read_parquet(parquet_path)
+        except ImportError:
+            pass
+    try:
+        data = pd.read_csv(path, index_col=0, engine='pyarrow')
+    except (ImportError, ValueError):
+        # pandas before 1.4 rejects the engine name with a ValueError
+        return pd.read_csv(path, index_col=0)
+    # pyarrow names a headerless index column '' where the C parser uses None
+    return data.rename_axis(data.index.name or None)
+
+
+@pytest.fixture(scope='session')
+def test_data_dir():
+    """The directory holding the CSV fixtures and their Parquet copies"""
+    return TEST_DATA_DIR
+
+
+@pytest.fixture(scope='session')
+def test_data_reader():
+    """The fixture loader itself, for tests of its fallbacks"""
+    return read_test_data
+
+
+@pytest.fixture(scope='session')
+def test_data():
+    """General purpose chart data, parsed once per session"""
+    return read_test_data(TEST_DATA_DIR.joinpath('test_data.csv'))
+
+
+@pytest.fixture(scope='session')
+def chart_datasets():
+    """Image comparison data keyed by file name, parsed once per session"""
+    return {i.stem: read_test_data(i) for i in TEST_DATA_DIR.glob('*.csv')}
+
+
+@pytest.fixture(scope='session')
+def render_digest():
+    """Hash of the package sources, style, logo, fonts and matplotlib
+    version, which every rendered chart depends on"""
+    digest = hashlib.sha256(matplotlib.__version__.encode())
+    paths = sorted(PACKAGE_DIR.glob('*.py')) + [
+        PACKAGE_DIR.joinpath('mercatus.mplstyle'),
+        PACKAGE_DIR.joinpath('mercatus_logo.eps'),
+    ] + sorted(i for i in PACKAGE_DIR.joinpath('fonts').rglob('*')
+               if i.is_file())
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@pytest.fixture
+def skip_unchanged_image(request, render_digest):
+    """
+    Under --mpl --mpl-skip-unchanged, skips an image comparison when its
+    chart settings, comparison settings, data and baseline match the last
+    time it passed
+    """
+    config = request.config
+    options = ('--mpl', '--mpl-skip-unchanged')
+    if not all(config.getoption(i) for i in options):
+        return
+    params = request.node.callspec.params
+    name = params['name']
+    digest = hashlib.sha256(render_digest.encode())
+    digest.update(repr(sorted(params['kwargs'].items())).encode())
+    # Tolerance, style and savefig_kwargs live on the marker, not the params
+    marker = request.node.get_closest_marker('mpl_image_compare')
+    digest.update(repr(sorted(marker.kwargs.items())).encode())
+    for path in sorted(TEST_DATA_DIR.glob(f'{name}.*')):
+        digest.update(path.read_bytes())
+    digest.update(BASELINE_DIR.joinpath(f'{name}.png').read_bytes())
+    cache_key = f'bluesteel/image_compare/{name}'
+    if config.cache.get(cache_key, None) == digest.hexdigest():
+        pytest.skip('inputs unchanged since the last passing comparison')
+    request.node.image_key = (cache_key, digest.hexdigest())
+
+
+@pytest.fixture(scope='class')
+def reused_figure():
+    """A figure that create_figure clears and redraws for each test in a
+    class, rather than building a new one per call"""
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Release any pyplot-managed figures so long-lived workers don't leak"""
+    yield
+    import matplotlib.pyplot as plt
+    plt.close('all')
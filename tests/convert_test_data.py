@@ -0,0 +1,21 @@
+"""
+Writes a Parquet copy of every CSV in tests/test_data so the test session
+can load fixtures without tokenizing text. Rerun after editing any CSV;
+until then the tests parse the edited CSV instead of its stale copy.
+"""
+import pandas as pd
+
+from pathlib import Path
+
+TEST_DATA_DIR = Path(__file__).parent.joinpath('test_data')
+
+
+def main():
+    """Converts each CSV fixture to Parquet alongside the original"""
+    for path in sorted(TEST_DATA_DIR.glob('*.csv')):
+        pd.read_csv(path, index_col=0).to_parquet(
+            path.with_suffix('.parquet'))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,9 @@
 import bluesteel.graphics
 import bluesteel.graphics.__main__
 import matplotlib
+import numpy as np
 import pandas as pd
 import pytest
-import sys
-
-from matplotlib.testing.decorators import cleanup, image_comparison
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent.resolve()))
 
 
 """
@@ -48,17 +43,19 @@ Main Functionality:
 
 """
 
-# PREPARATION
-test_data = pd.read_csv('tests/test_data/test_data.csv', index_col=0)
-
 # GENERAL
+# Parsed once so pytest-mpl doesn't re-read the style file for every test
+MERCATUS_STYLE = matplotlib.rc_params_from_file(
+    str(bluesteel.graphics.standard_formatting.STYLE_PATH),
+    use_default_template=False
+)
+SAVEFIG_KWARGS = {'bbox_inches': 'tight', 'pil_kwargs': {'compress_level': 1}}
 
 
 # PROGRAMMATIC INTERFACE
-class TestBadChartParams(object):
+class TestBadChartParams:
 
-    @cleanup
-    def test_bad_chart_types(self):
+    def test_bad_chart_types(self, test_data):
         """Should only run on specific types of charts"""
         with pytest.raises(NotImplementedError):
             bluesteel.graphics.create_figure(
@@ -66,7 +63,7 @@ class TestBadChartParams(object):
                 data=test_data
             )
 
-    def test_extra_params(self):
+    def test_extra_params(self, test_data):
         """Should raise an error if incorrect params are provided"""
         with pytest.raises(AttributeError):
             bluesteel.graphics.create_figure(
@@ -75,29 +72,44 @@ class TestBadChartParams(object):
             )
 
 
-class TestValidChartTypes(object):
+class TestValidChartTypes:
 
-    @cleanup
-    def test_chart_types(self):
+    def test_chart_types(self, test_data):
         for type in ['line', 'stacked_area', 'scatter',
                      'horizontal_bar', 'vertical_bar']:
             bluesteel.graphics.create_figure(kind=type, data=test_data)
 
 
-class TestChartReturnFormats(object):
+class TestChartReturnFormats:
 
-    @cleanup
-    def test_return_image(self):
+    # TODO, figure out : 'ps', 'eps',
+    @pytest.mark.parametrize('format, signature', [
+        ('pdf', b'%PDF'),
+        ('png', b'\x89PNG'),
+        ('raw', b''),
+        ('rgba', b''),
+        ('svg', b'<?xml'),
+        ('svgz', b'\x1f\x8b'),
+    ])
+    def test_return_image(self, format, signature, test_data):
         """Should return proper image formats when specified"""
-        types = ['pdf', 'png', 'raw', 'rgba', 'svg', 'svgz']
-        # TODO, figure out : 'ps', 'eps',
-
-        for format in types:
-            assert format == Path(bluesteel.graphics.__main__.save_fig(
-                data=test_data,
-                outfile=f'tests/test_output/output.{format}')).suffix[1:]
-
-    def test_return_object(self):
+        # Tests never ship the bytes, so trade PNG size for encode speed
+        pil_kwargs = {'compress_level': 1} if format == 'png' else None
+        image = bluesteel.graphics.create_image(
+            test_data, format, pil_kwargs=pil_kwargs).read()
+        assert image and image.startswith(signature)
+
+    def test_save_leaves_data_unchanged(self, test_data, tmp_path):
+        """Should not convert the index of data shared between tests"""
+        data = test_data.set_index(pd.Index(
+            [f'2000-01-{i:02}' for i in range(1, len(test_data) + 1)],
+            dtype=object
+        ))
+        bluesteel.graphics.__main__.save_fig(
+            data=data, outfile=tmp_path.joinpath('output.png'))
+        assert data.index.dtype == 'O'
+
+    def test_return_object(self, test_data):
         """Should return a graphics object for further testing when
         requested"""
         assert isinstance(
@@ -106,59 +118,76 @@ class TestChartReturnFormats(object):
         )
 
 
-class TestChartElements(object):
+class TestChartElements:
 
-    @cleanup
-    def test_chart_title(self):
+    def test_chart_title(self, test_data, reused_figure):
         """Should contain a title when passed a valid string"""
         assert ('test_title' == bluesteel.graphics.create_figure(
             test_data,
             kind='line',
-            title='test_title'
+            title='test_title',
+            fig=reused_figure
         ).gca().get_title())
 
-    @cleanup
-    def test_axis_titles(self):
+    def test_axis_titles(self, test_data, reused_figure):
         """Should contain axes titles when passed valid strings"""
-        assert ('test_ylabel' == bluesteel.graphics.create_figure(
+        ax = bluesteel.graphics.create_figure(
             test_data,
-            ylabel='test_ylabel'
-        ).gca().get_ylabel().strip())
-
-        assert ('test_xlabel' == bluesteel.graphics.create_figure(
-            test_data,
-            xlabel='test_xlabel'
-        ).gca().get_xlabel().strip())
-
-    @cleanup
-    def test_axis_limits(self):
+            ylabel='test_ylabel',
+            xlabel='test_xlabel',
+            fig=reused_figure
+        ).gca()
+        assert 'test_ylabel' == ax.get_ylabel().strip()
+        assert 'test_xlabel' == ax.get_xlabel().strip()
+
+    def test_axis_limits(self, test_data, reused_figure):
         """Should limit data to specific bounds on request"""
-        assert ((1, 20,) == bluesteel.graphics.create_figure(
+        ax = bluesteel.graphics.create_figure(
             test_data,
             ymin=1,
-            ymax=20
-        ).gca().get_ylim())
-        assert ((1, 20,) == bluesteel.graphics.create_figure(
-            test_data,
+            ymax=20,
             xmin=1,
-            xmax=20
-        ).gca().get_xlim())
+            xmax=20,
+            fig=reused_figure
+        ).gca()
+        assert (1, 20,) == ax.get_ylim()
+        assert (1, 20,) == ax.get_xlim()
 
-    @cleanup
     def test_source_notes(self):
         """Should contain source notes when passed valid options"""
         pass
 
-    @cleanup
     def test_annotations(self):
         """Should contain annotations if possible when passed valid
         parameters"""
         pass
 
+    def test_stacked_bottoms(self):
+        """Should stack each segment on the running total of the segments
+        before it, skipping missing values"""
+        values = np.array([[1, 2, 3], [1, np.nan, 2]])
+        np.testing.assert_array_equal(
+            bluesteel.graphics.graphics.stacked_bottoms(values),
+            [[0, 1, 3], [0, 1, 1]]
+        )
+
+    def test_reuse_figure(self, test_data):
+        """Should clear and draw on a figure when one is passed in"""
+        fig = bluesteel.graphics.create_figure(data=test_data)
+        reused = bluesteel.graphics.create_figure(
+            data=test_data,
+            kind='vertical_bar',
+            title='test_title',
+            fig=fig
+        )
+        assert reused is fig
+        assert len(fig.axes) == 1
+        assert fig.gca().get_title() == 'test_title'
 
-class TestImageCreation(object):
+
+class TestImageCreation:
     # TODO: Need to check against correct files
-    def test_return_object(self):
+    def test_return_object(self, test_data):
         """
         Tests if the returned object has a read() function that produces bytes
         """
@@ -167,408 +196,238 @@ class TestImageCreation(object):
         )
         assert isinstance(imgbuf.read(), bytes)
 
+    def test_return_array(self, test_data):
+        """
+        Tests if the returned array holds RGBA pixels of the full figure
+        """
+        fig = bluesteel.graphics.create_figure(data=test_data)
+        width, height = fig.get_size_inches() * fig.dpi
+        pixels = bluesteel.graphics.create_array(data=test_data)
+        assert pixels.shape == (round(height), round(width), 4)
 
-class TestImageComparison(object):
-    # Scatter plot tests
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='scatter_test_1.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_scatterplot_1(self):
-        data = pd.read_csv('tests/test_data/scatter_test_1.csv', index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="scatter",
-            title="Sample Scatter Plot",
-            source="Source: Random Data Generation",
-            xlabel_off=True,
-            ytick_loc=[5000],
-            xmin=1500,
-            yticklabels=["test_label"],
-            grid=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='scatter_test_2.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_scatterplot_2(self):
-        data = pd.read_csv('tests/test_data/scatter_test_2.csv', index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="scatter",
-            title="Sample Scatter Plot",
-            source="Source: Random Data Generation",
-            xlabel_off=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='scatter_test_3.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_scatterplot_3(self):
-        data = pd.read_csv('tests/test_data/scatter_test_3.csv', index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="scatter",
-            title="Sample Scatter Plot",
-            source="Source: Random Data Generation",
-            xlabel_off=True,
-            spines=True
+    def test_return_objects(self, test_data):
+        """
+        Tests if a batch of charts returns one image buffer per input
+        """
+        imgbufs = bluesteel.graphics.create_images(
+            [test_data, test_data],
+            workers=2
         )
-        return fig
+        assert len(imgbufs) == 2
+        assert all(isinstance(i.read(), bytes) for i in imgbufs)
 
-    # Line Chart Tests
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='line_test_1.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_line_1(self):
-        data = pd.read_csv('tests/test_data/line_test_1.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            title='Accumulation of Federal Regulation, 1970-2016',
-            kind='line',
-            source='Source: Patrick A. McLaughlin and Oliver Sherouse',
-            ylabel='thousands of regulatory restrictions',
-            ytick_loc=[250000, 500000, 750000, 1000000, 1250000],
-            xlabel_off=True,
-            xyear=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='line_test_2.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_line_2(self):
-        data = pd.read_csv('tests/test_data/line_test_2.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            title='Accumulation of Federal Regulation, 1970-2016',
-            kind='line',
-            source='Source: Patrick A. McLaughlin and Oliver Sherouse',
-            ylabel='thousands of regulatory restrictions',
-            xlabel_off=True,
-            xtick_loc=[1980, 1990, 2000],
-            xticklabels=['hi', 'hello', 'goodbye'],
-            xmin=1980
+    def test_return_batch(self, test_data):
+        """
+        Tests if a batch of differently configured charts returns one image
+        buffer per job
+        """
+        imgbufs = bluesteel.graphics.create_image_batch(
+            [{'data': test_data, 'kind': 'line'},
+             {'data': test_data, 'kind': 'vertical_bar', 'format': 'svg'}],
+            workers=2
         )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='line_test_3.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_line_3(self):
-        data = pd.read_csv('tests/test_data/line_test_3.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind='line',
-            grid=True,
-            label_lines=True
+        assert len(imgbufs) == 2
+        assert imgbufs[1].read().lstrip().startswith(b'<?xml')
+
+    def test_batch_rejects_figure(self, test_data, reused_figure):
+        """Should refuse jobs that pass their own figure to a worker"""
+        with pytest.raises(TypeError):
+            bluesteel.graphics.create_image_batch(
+                [{'data': test_data, 'fig': reused_figure}], workers=1)
+
+
+def image_case(name, tolerance=5, **kwargs):
+    """Pairs a dataset and chart settings with the baseline image to match"""
+    return pytest.param(
+        name, kwargs, id=name,
+        marks=pytest.mark.mpl_image_compare(
+            baseline_dir='baseline',
+            filename=f'{name}.png',
+            style=MERCATUS_STYLE,
+            savefig_kwargs=SAVEFIG_KWARGS,
+            tolerance=tolerance
         )
-        return fig
+    )
 
-    # Stacked Area Tests
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_area_test_1.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_stacked_area_1(self):
-        data = pd.read_csv('tests/test_data/stacked_area_test_1.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            title='A Test Chart',
-            kind='stacked_area',
-            spines=True,
-            xyear=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_area_test_2.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5.7)
-    def test_stacked_area_2(self):
-        data = pd.read_csv('tests/test_data/stacked_area_test_2.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            title='A Test Chart',
-            kind='stacked_area',
-            label_area=True,
-            xyear=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_area_test_3.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5.7)
-    def test_stacked_area_3(self):
-        data = pd.read_csv('tests/test_data/stacked_area_test_3.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            title='A Test Chart',
-            kind='stacked_area',
-            xmin=1980,
-            xmax=2010,
-            ymin=5000,
-            label_area=True,
-            xyear=True
-        )
-        return fig
 
+IMAGE_CASES = [
+    # Scatter plot tests
+    image_case('scatter_test_1',
+               kind='scatter',
+               title='Sample Scatter Plot',
+               source='Source: Random Data Generation',
+               xlabel_off=True,
+               ytick_loc=[5000],
+               xmin=1500,
+               yticklabels=['test_label'],
+               grid=True),
+    image_case('scatter_test_2',
+               kind='scatter',
+               title='Sample Scatter Plot',
+               source='Source: Random Data Generation',
+               xlabel_off=True),
+    image_case('scatter_test_3',
+               kind='scatter',
+               title='Sample Scatter Plot',
+               source='Source: Random Data Generation',
+               xlabel_off=True,
+               spines=True),
+    # Line Chart Tests
+    image_case('line_test_1',
+               title='Accumulation of Federal Regulation, 1970-2016',
+               kind='line',
+               source='Source: Patrick A. McLaughlin and Oliver Sherouse',
+               ylabel='thousands of regulatory restrictions',
+               ytick_loc=[250000, 500000, 750000, 1000000, 1250000],
+               xlabel_off=True,
+               xyear=True),
+    image_case('line_test_2',
+               title='Accumulation of Federal Regulation, 1970-2016',
+               kind='line',
+               source='Source: Patrick A. McLaughlin and Oliver Sherouse',
+               ylabel='thousands of regulatory restrictions',
+               xlabel_off=True,
+               xtick_loc=[1980, 1990, 2000],
+               xticklabels=['hi', 'hello', 'goodbye'],
+               xmin=1980),
+    image_case('line_test_3',
+               kind='line',
+               grid=True,
+               label_lines=True),
+    # Stacked Area Tests
+    image_case('stacked_area_test_1',
+               title='A Test Chart',
+               kind='stacked_area',
+               spines=True,
+               xyear=True),
+    image_case('stacked_area_test_2', tolerance=5.7,
+               title='A Test Chart',
+               kind='stacked_area',
+               label_area=True,
+               xyear=True),
+    image_case('stacked_area_test_3', tolerance=5.7,
+               title='A Test Chart',
+               kind='stacked_area',
+               xmin=1980,
+               xmax=2010,
+               ymin=5000,
+               label_area=True,
+               xyear=True),
     # Vertical Bar Chart Tests
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='vertical_bar_test_1.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_vbar_1(self):
-        data = pd.read_csv('tests/test_data/vertical_bar_test_1.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="vertical_bar",
-            title="A Test Chart",
-            xyear=True,
-            label_bars=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='vertical_bar_test_2.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_vbar_2(self):
-        data = pd.read_csv('tests/test_data/vertical_bar_test_2.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="vertical_bar",
-            title="A Test Chart",
-            source="The chart was made with love.",
-            spines=True,
-            label_bars=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='vertical_bar_test_3.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_vbar_3(self):
-        data = pd.read_csv('tests/test_data/vertical_bar_test_3.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="vertical_bar",
-            xticklabels=['bar1', 'bar2', 'bar3', 'bar4'],
-            ytick_loc=30,
-            yticklabels=["label"]
-        )
-        return fig
-
+    image_case('vertical_bar_test_1',
+               kind='vertical_bar',
+               title='A Test Chart',
+               xyear=True,
+               label_bars=True),
+    image_case('vertical_bar_test_2',
+               kind='vertical_bar',
+               title='A Test Chart',
+               source='The chart was made with love.',
+               spines=True,
+               label_bars=True),
+    image_case('vertical_bar_test_3',
+               kind='vertical_bar',
+               xticklabels=['bar1', 'bar2', 'bar3', 'bar4'],
+               ytick_loc=30,
+               yticklabels=['label']),
     # Stacked Vertical Bar Chart Tests
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_vbar_test_1.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_vbar_stack_1(self):
-        data = pd.read_csv('tests/test_data/stacked_vbar_test_1.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="stacked_vbar",
-            xyear=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_vbar_test_2.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_vbar_stack_2(self):
-        data = pd.read_csv('tests/test_data/stacked_vbar_test_2.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="stacked_vbar",
-            xticklabels=["a", "b", " ", "d", "e", " ", "g"],
-            xlabel_off=True,
-            spines=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_vbar_test_3.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_vbar_stack_3(self):
-        data = pd.read_csv('tests/test_data/stacked_vbar_test_3.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="stacked_vbar",
-            xticklabels=["I", "am", "", "rotating", "", "some", "labels"],
-            xlabel_off=True,
-            rot=45,
-            ytick_loc=[20, 40, 45]
-        )
-        return fig
-
+    image_case('stacked_vbar_test_1',
+               kind='stacked_vbar',
+               xyear=True),
+    image_case('stacked_vbar_test_2',
+               kind='stacked_vbar',
+               xticklabels=['a', 'b', ' ', 'd', 'e', ' ', 'g'],
+               xlabel_off=True,
+               spines=True),
+    image_case('stacked_vbar_test_3',
+               kind='stacked_vbar',
+               xticklabels=['I', 'am', '', 'rotating', '', 'some', 'labels'],
+               xlabel_off=True,
+               rot=45,
+               ytick_loc=[20, 40, 45]),
     # Horizontal Bar Chart Tests
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='hbar_test_1.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_hbar_1(self):
-        data = pd.read_csv('tests/test_data/hbar_test_1.csv', index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="horizontal_bar",
-            title="A Test Chart",
-            xlabel="hello",
-            ylabel_off=True,
-            grid=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='hbar_test_2.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_hbar_2(self):
-        data = pd.read_csv('tests/test_data/hbar_test_2.csv', index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="horizontal_bar",
-            title="A Test Chart",
-            xlabel="hello",
-            spines=True,
-            label_bars=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='hbar_test_3.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_hbar_3(self):
-        data = pd.read_csv('tests/test_data/hbar_test_3.csv', index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="horizontal_bar",
-            title="A Test Chart",
-            xtick_loc=[5, 10],
-            xticklabels=["hi", "hello"]
-        )
-        return fig
-
+    image_case('hbar_test_1',
+               kind='horizontal_bar',
+               title='A Test Chart',
+               xlabel='hello',
+               ylabel_off=True,
+               grid=True),
+    image_case('hbar_test_2',
+               kind='horizontal_bar',
+               title='A Test Chart',
+               xlabel='hello',
+               spines=True,
+               label_bars=True),
+    image_case('hbar_test_3',
+               kind='horizontal_bar',
+               title='A Test Chart',
+               xtick_loc=[5, 10],
+               xticklabels=['hi', 'hello']),
     # Stacked Horizontal Bar Chart Tests
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_hbar_test_1.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_hbar_stack_1(self):
-        data = pd.read_csv('tests/test_data/stacked_hbar_test_1.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="stacked_hbar",
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_hbar_test_2.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_hbar_stack_2(self):
-        data = pd.read_csv('tests/test_data/stacked_hbar_test_2.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="stacked_hbar",
-            spines=True,
-            xlabel_off=True
-        )
-        return fig
-
-    @pytest.mark.mpl_image_compare(baseline_dir='baseline',
-                                   filename='stacked_hbar_test_3.png',
-                                   style=('bluesteel/graphics/mercatus.'
-                                          'mplstyle'),
-                                   savefig_kwargs={'bbox_inches': 'tight'},
-                                   tolerance=5)
-    def test_hbar_stack_3(self):
-        data = pd.read_csv('tests/test_data/stacked_hbar_test_3.csv',
-                           index_col=0)
-        fig = bluesteel.graphics.create_figure(
-            data=data,
-            kind="stacked_hbar",
-            xtick_loc=[20, 40],
-            xticklabels=["test", "test"]
-        )
-        return fig
+    image_case('stacked_hbar_test_1',
+               kind='stacked_hbar'),
+    image_case('stacked_hbar_test_2',
+               kind='stacked_hbar',
+               spines=True,
+               xlabel_off=True),
+    image_case('stacked_hbar_test_3',
+               kind='stacked_hbar',
+               xtick_loc=[20, 40],
+               xticklabels=['test', 'test']),
+]
+
+
+class TestImageComparison:
+
+    @pytest.mark.parametrize('name, kwargs', IMAGE_CASES)
+    def test_chart(self, name, kwargs, chart_datasets,
+                   skip_unchanged_image):
+        return bluesteel.graphics.create_figure(
+            data=chart_datasets[name], **kwargs)
+
+
+# TEST FIXTURES
+class TestFixtureLoading:
+
+    @pytest.mark.parametrize('pyarrow_engine', [True, False])
+    def test_csv_fallback(self, pyarrow_engine, test_data_reader,
+                          test_data_dir, tmp_path, monkeypatch):
+        """Should parse a CSV without a Parquet copy, even on pandas versions
+        that reject the pyarrow engine"""
+        path = tmp_path.joinpath('line_test_3.csv')
+        path.write_bytes(
+            test_data_dir.joinpath('line_test_3.csv').read_bytes())
+        expected = pd.read_csv(path, index_col=0)
+        if not pyarrow_engine:
+            read_csv = pd.read_csv
+
+            def read_csv_without_pyarrow(*args, engine='c', **kwargs):
+                if engine == 'pyarrow':
+                    raise ValueError(f'Unknown engine: {engine}')
+                return read_csv(*args, engine=engine, **kwargs)
+
+            monkeypatch.setattr(pd, 'read_csv', read_csv_without_pyarrow)
+        pd.testing.assert_frame_equal(test_data_reader(path), expected)
+
+    def test_parquet_copies_match(self, test_data_dir):
+        """Should keep every committed Parquet copy identical to its CSV,
+        since a checkout can leave a stale copy newer than its CSV"""
+        pytest.importorskip('pyarrow')
+        for path in sorted(test_data_dir.glob('*.csv')):
+            pd.testing.assert_frame_equal(
+                pd.read_parquet(path.with_suffix('.parquet')),
+                pd.read_csv(path, index_col=0), obj=path.name)
 
 
 # COMMAND LINE INTERFACE
-class TestCLI(object):
+class TestCLI:
 
-    def test_file_generation(self):
+    def test_file_generation(self, tmp_path):
         """File should run without error for basic arguments."""
+        outfile = tmp_path.joinpath('testchart.png')
         bluesteel.graphics.__main__.main(
-            args=['tests/test_data/test_data.csv', '-o',
-                  'tests/test_output/testchart.png', '--title', 'test_title',
-                  '--ylabel', 'count', '--xlabel', 'date', '--source',
-                  'quantgov.org']
+            args=['tests/test_data/test_data.csv', '-o', str(outfile),
+                  '--title', 'test_title', '--ylabel', 'count', '--xlabel',
+                  'date', '--source', 'quantgov.org']
         )
-        assert Path('tests/test_output/testchart.png').exists()
+        assert outfile.exists()